@@ -16,12 +16,30 @@ import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import pygame
 import pystray
 from PIL import Image
 from pystray import MenuItem as item
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _json_dumps(data: Any) -> str:
+    """Serialize data to indented JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 class Config:
     """Handles configuration management with persistent JSON storage."""
@@ -34,6 +52,10 @@ class Config:
             "sound_enabled": True
         }
         self.config: Dict[str, Any] = {}
+        self.work_start_hour: int = self.default_config["work_start_hour"]
+        self.work_end_hour: int = self.default_config["work_end_hour"]
+        self.sound_enabled: bool = self.default_config["sound_enabled"]
+        self._mtime: Optional[int] = None
         self.load_config()
 
     def load_config(self) -> None:
@@ -41,7 +63,7 @@ class Config:
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
+                    self.config = _json_loads(f.read())
                     # Ensure all default keys exist
                     for key, value in self.default_config.items():
                         if key not in self.config:
@@ -51,14 +73,47 @@ class Config:
                 self.save_config()
         except Exception:
             self.config = self.default_config.copy()
+        self._mtime = self._stat_mtime()
+        self._sync_attributes()
+
+    def reload_if_changed(self) -> bool:
+        """Reload configuration only if the file changed since it was last read.
+
+        Returns:
+            True if the configuration was reloaded
+        """
+        if self._stat_mtime() == self._mtime:
+            return False
+        self.load_config()
+        return True
+
+    def _stat_mtime(self) -> Optional[int]:
+        """Get the config file modification time, or None if unavailable."""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _sync_attributes(self) -> None:
+        """Mirror frequently read values into plain attributes."""
+        self.work_start_hour = self.get("work_start_hour")
+        self.work_end_hour = self.get("work_end_hour")
+        self.sound_enabled = self.get("sound_enabled")
 
     def save_config(self) -> None:
         """Save current configuration to JSON file."""
+        # Write a sibling file and rename it over the original, so a crash
+        # mid-write can never leave a truncated config.json behind
+        tmp_file = self.config_file.with_suffix('.json.tmp')
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Serialize up front so the file gets a single write
+            data = _json_dumps(self.config)
+            with open(tmp_file, 'w') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
         except Exception:
             pass
+        self._mtime = self._stat_mtime()
 
     def get(self, key: str) -> Any:
         """Get configuration value with fallback to default."""
@@ -66,63 +121,117 @@ class Config:
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value and save to file."""
-        self.config[key] = value
+        self.update(**{key: value})
+
+    def update(self, **values: Any) -> None:
+        """Set several configuration values and save to file once."""
+        for key, value in values.items():
+            self.config[key] = value
+            if key in ("work_start_hour", "work_end_hour", "sound_enabled"):
+                setattr(self, key, value)
         self.save_config()
 
-class AlarmTimer(threading.Thread):
-    """Background thread that monitors time and triggers alarms."""
-
-    def __init__(self, config: Config, app: 'PyAlarmApp') -> None:
-        """Initialize alarm timer thread.
-
-        Args:
-            config: Configuration instance
-            app: Main application instance for playing alarms
-        """
-        super().__init__()
-        self.config = config
-        self.app = app
-        self.running = True
-        self.daemon = True
-
-    def run(self) -> None:
-        """Main loop that checks time and triggers alarms."""
-        last_trigger = {"halfpast": -1, "bell": -1}
-
-        while self.running:
-            now = datetime.now()
-            current_hour = now.hour
-            current_minute = now.minute
-
-            work_start = self.config.get("work_start_hour")
-            work_end = self.config.get("work_end_hour")
-
-            # Only trigger alarms during work hours
-            if work_start <= current_hour < work_end:
-                # Check for HalfPast at 29 minutes past
-                if current_minute == 29 and last_trigger["halfpast"] != current_hour:
-                    self.app.play_alarm("halfpast")
-                    last_trigger["halfpast"] = current_hour
-                # Check for Bell at 59 minutes past
-                elif current_minute == 59 and last_trigger["bell"] != current_hour:
-                    self.app.play_alarm("bell")
-                    last_trigger["bell"] = current_hour
-
-            time.sleep(30)  # Check every 30 seconds
-
-    def stop(self) -> None:
-        """Stop the alarm timer thread."""
-        self.running = False
+def _next_trigger(config: Config, now: float) -> Optional[Tuple[float, str]]:
+    """Find the next :29 or :59 boundary after now that falls in work hours.
+
+    Args:
+        config: Configuration instance providing the work hours
+        now: Reference time to search forward from, in epoch seconds
+
+    Returns:
+        Tuple of (fire time in epoch seconds, alarm type), or None if no
+        work hours are set
+    """
+    work_start = config.work_start_hour
+    work_end = config.work_end_hour
+    if not work_start < work_end:
+        return None
+
+    year, month, day, hour = time.localtime(now)[:4]
+    # Two boundaries per hour, so one day of candidates covers every case;
+    # mktime normalizes hours past 23 into the following day
+    for step in range(48):
+        hour_offset, second_half = divmod(step, 2)
+        minute = 59 if second_half else 29
+        fire_at = time.mktime((year, month, day, hour + hour_offset, minute, 0, 0, 0, -1))
+        if fire_at > now and work_start <= time.localtime(fire_at).tm_hour < work_end:
+            return fire_at, "bell" if second_half else "halfpast"
+    return None
+
+# The schedule is in wall-clock time but Event.wait times out on the
+# monotonic clock, which stops during suspend and ignores clock changes.
+# Capping each wait bounds how far the two can drift apart.
+_MAX_WAIT_SECONDS = 60.0
+
+def _alarm_worker(app: 'PyAlarmApp', stop_event: threading.Event,
+                  wake_event: threading.Event) -> None:
+    """Background loop that sleeps until an alarm or icon change is due.
+
+    Args:
+        app: Main application instance for playing alarms and icon updates
+        stop_event: Set to make the loop exit
+        wake_event: Set to interrupt the current sleep and recompute the schedule
+    """
+    # Bind everything the loop touches to locals once
+    config = app.config
+    refresh_icon = app.refresh_icon
+    next_icon_change = app.next_icon_change
+    play_alarm = app.play_alarm
+    now_fn = time.time
+
+    while not stop_event.is_set():
+        wake_event.clear()
+        # Runs at least once per capped wait, so external edits to config.json
+        # are picked up within _MAX_WAIT_SECONDS; the file is only re-parsed
+        # when its mtime changed
+        if config.reload_if_changed():
+            refresh_icon()
+        now = now_fn()
+        trigger = _next_trigger(config, now)
+        icon_change = next_icon_change(now)
+
+        deadline = icon_change if trigger is None else min(trigger[0], icon_change)
+        timeout = min(max(0.0, deadline - now_fn()), _MAX_WAIT_SECONDS)
+
+        # Woken early by exit or a state change
+        if wake_event.wait(timeout):
+            if stop_event.is_set():
+                break
+            continue
+
+        now = now_fn()
+        # Checked after every capped wait, not only when the alarm is due, so
+        # an icon boundary crossed during a suspend is caught within the cap.
+        # Refresh first so an expired pause is cleared before alarms run.
+        if now >= icon_change:
+            refresh_icon()
+        if trigger is not None:
+            fire_at, alarm_type = trigger
+            # Capped wait ended before the alarm is due, keep waiting
+            if now < fire_at:
+                continue
+            # _next_trigger only returns times inside work hours, and any
+            # work-hours change wakes us to recompute, so play_alarm
+            # does not recheck them. A boundary more than a minute in the
+            # past was slept through, e.g. during a system suspend, and is
+            # skipped; the next loop schedules the one after it.
+            if now < fire_at + 60:
+                play_alarm(alarm_type)
 
 class PyAlarmApp:
     """Main application class that manages the system tray and alarms."""
 
     def __init__(self) -> None:
         """Initialize the PyAlarm application."""
+        self.icon: Optional[pystray.Icon] = None
         self.config = Config()
 
         # Initialize pygame for sound
         pygame.mixer.init()
+        # All sounds share one reserved channel, so a new sound replaces the
+        # one playing instead of overlapping it, as mixer.music did
+        pygame.mixer.set_reserved(1)
+        self._channel = pygame.mixer.Channel(0)
 
         # Paths to resources
         self.base_path = Path(__file__).parent
@@ -132,29 +241,78 @@ class PyAlarmApp:
         self.bell_sound = str(self.base_path / "Bell.wav")
         self.halfpast_sound = str(self.base_path / "HalfPast.wav")
 
+        # Resource files are fixed at install time, check them only once
+        self._bell_ok = os.path.isfile(self.bell_sound)
+        self._halfpast_ok = os.path.isfile(self.halfpast_sound)
+
+        # Decode sounds up front so playing one never touches the disk
+        self._sounds: Dict[str, Optional[pygame.mixer.Sound]] = {
+            "bell": self._load_sound(self.bell_sound) if self._bell_ok else None,
+            "halfpast": self._load_sound(self.halfpast_sound) if self._halfpast_ok else None,
+        }
+
         # State management
         self.is_paused = False
         self.pause_until: Optional[datetime] = None
-
-        # Load images
-        self.active_image = Image.open(self.active_icon) if os.path.exists(self.active_icon) else None
-        self.inactive_image = Image.open(self.inactive_icon) if os.path.exists(self.inactive_icon) else None
-        self.paused_image = Image.open(self.paused_icon) if os.path.exists(self.paused_icon) else None
+        # One of "active", "inactive" or "paused", see _update_tray_state
+        self._tray_state: str = "active"
+
+        # Images are opened on first display, see _get_image
+        self._icon_paths: Dict[str, str] = {
+            "active": self.active_icon,
+            "inactive": self.inactive_icon,
+            "paused": self.paused_icon,
+        }
+        self._state_image: Dict[str, Optional[Image.Image]] = {}
+        self._current_icon_image: Optional[Image.Image] = None
 
         # Create system tray icon
+        self._update_tray_state()
         self.setup_tray_icon()
 
-        # Start update timer in a separate thread
-        self.update_timer_thread = threading.Thread(target=self.update_timer_loop, daemon=True)
-        self.update_timer_thread.start()
+        # Alarm timer thread, also keeps the tray icon up to date
+        self._alarm_stop = threading.Event()
+        self._alarm_wake = threading.Event()
+        self._alarm_thread = threading.Thread(
+            target=_alarm_worker,
+            args=(self, self._alarm_stop, self._alarm_wake),
+            daemon=True
+        )
+        self._alarm_thread.start()
 
-        # Alarm timer thread
-        self.alarm_timer = AlarmTimer(self.config, self)
-        self.alarm_timer.start()
+    @staticmethod
+    def _load_sound(path: str) -> Optional[pygame.mixer.Sound]:
+        """Load a sound file, returning None if it cannot be decoded."""
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error:
+            return None
+
+    @staticmethod
+    def _load_image(path: str) -> Optional[Image.Image]:
+        """Open an icon image, returning None if it is missing or unreadable."""
+        try:
+            return Image.open(path)
+        except OSError:
+            return None
+
+    def _get_image(self, state: str) -> Optional[Image.Image]:
+        """Get the icon image for a tray state, opening it on first use.
+
+        States whose own image is unavailable fall back to the active icon.
+        """
+        if state not in self._state_image:
+            image = self._load_image(self._icon_paths[state])
+            if image is None and state != "active":
+                image = self._get_image("active")
+            self._state_image[state] = image
+        return self._state_image[state]
 
     def setup_tray_icon(self) -> None:
         """Set up the system tray icon and context menu."""
-        # Create menu
+        # Create menu. Actions stay lambdas: pystray inspects __code__ to see
+        # how many arguments to pass, and calls anything without it (such as
+        # functools.partial) with (icon, item), which our methods don't take.
         menu = pystray.Menu(
             item("🔊 Test HalfPast Sound (:29)", lambda: self.test_sound("halfpast")),
             item("🔔 Test Bell Sound (:59)", lambda: self.test_sound("bell")),
@@ -166,112 +324,130 @@ class PyAlarmApp:
             pystray.Menu.SEPARATOR,
             item("Work Hours", pystray.Menu(
                 item("6:00 - 16:00", lambda: self.set_work_hours(6, 16),
-                     checked=lambda item: self.config.get("work_start_hour") == 6 and self.config.get("work_end_hour") == 16),
+                     checked=lambda item, s=6, e=16: self._hours_are(s, e)),
                 item("7:00 - 17:00", lambda: self.set_work_hours(7, 17),
-                     checked=lambda item: self.config.get("work_start_hour") == 7 and self.config.get("work_end_hour") == 17),
+                     checked=lambda item, s=7, e=17: self._hours_are(s, e)),
                 item("8:00 - 18:00", lambda: self.set_work_hours(8, 18),
-                     checked=lambda item: self.config.get("work_start_hour") == 8 and self.config.get("work_end_hour") == 18),
+                     checked=lambda item, s=8, e=18: self._hours_are(s, e)),
                 item("9:00 - 19:00", lambda: self.set_work_hours(9, 19),
-                     checked=lambda item: self.config.get("work_start_hour") == 9 and self.config.get("work_end_hour") == 19),
+                     checked=lambda item, s=9, e=19: self._hours_are(s, e)),
             )),
             pystray.Menu.SEPARATOR,
             item("Exit", self.exit_app)
         )
 
         # Create tray icon
+        self._current_icon_image = self.get_current_image()
         self.icon = pystray.Icon(
             "PyAlarm",
-            self.get_current_image(),
+            self._current_icon_image,
             menu=menu
         )
 
+    def _hours_are(self, start_hour: int, end_hour: int) -> bool:
+        """Check whether the configured work hours match a preset."""
+        return (self.config.work_start_hour, self.config.work_end_hour) == (start_hour, end_hour)
+
     def get_current_image(self) -> Optional[Image.Image]:
-        """Get the appropriate tray icon based on current state."""
-        now = datetime.now()
+        """Get the tray icon for the current state."""
+        return self._get_image(self._tray_state)
 
+    def _update_tray_state(self) -> None:
+        """Recompute the tray state, expiring the pause if it has run out."""
         # Check if pause has expired
-        if self.is_paused and self.pause_until and now >= self.pause_until:
+        if self.is_paused and self.pause_until and datetime.now() >= self.pause_until:
             self.is_paused = False
             self.pause_until = None
 
-        # Determine which icon to show
         if self.is_paused:
-            return self.paused_image or self.active_image
+            self._tray_state = "paused"
+        elif self.config.work_start_hour <= time.localtime().tm_hour < self.config.work_end_hour:
+            self._tray_state = "active"
         else:
-            work_start = self.config.get("work_start_hour")
-            work_end = self.config.get("work_end_hour")
-            current_hour = now.hour
+            self._tray_state = "inactive"
 
-            if work_start <= current_hour < work_end:
-                return self.active_image
-            else:
-                return self.inactive_image or self.active_image
+    def refresh_icon(self) -> None:
+        """Recompute the tray state and update the icon if it changed."""
+        self._update_tray_state()
+        if self.icon is not None:
+            image = self.get_current_image()
+            # Reassigning makes pystray push the bitmap to the OS again
+            if image is not self._current_icon_image:
+                self.icon.icon = image
+                self._current_icon_image = image
+
+    def next_icon_change(self, now: float) -> float:
+        """Find the next time the tray icon state can change.
+
+        Args:
+            now: Reference time to search forward from, in epoch seconds
 
-    def update_timer_loop(self) -> None:
-        """Background loop to update tray icon state periodically."""
-        while True:
-            time.sleep(60)  # Update every minute
-            if hasattr(self, 'icon'):
-                self.icon.icon = self.get_current_image()
+        Returns:
+            Earliest of pause expiry, next work start and next work end, in
+            epoch seconds
+        """
+        candidates: List[float] = []
+        pause_until = self.pause_until
+        if self.is_paused and pause_until:
+            candidates.append(pause_until.timestamp())
+        year, month, day = time.localtime(now)[:3]
+        for hour in (self.config.work_start_hour, self.config.work_end_hour):
+            boundary = time.mktime((year, month, day, hour, 0, 0, 0, 0, -1))
+            if boundary <= now:
+                boundary = time.mktime((year, month, day + 1, hour, 0, 0, 0, 0, -1))
+            candidates.append(boundary)
+        return min(candidates)
 
     def set_work_hours(self, start_hour: int, end_hour: int) -> None:
         """Set work hours configuration."""
-        self.config.set("work_start_hour", start_hour)
-        self.config.set("work_end_hour", end_hour)
+        self.config.update(work_start_hour=start_hour, work_end_hour=end_hour)
+        self.refresh_icon()
+        self._alarm_wake.set()
 
     def pause_alarms(self, minutes: int) -> None:
         """Pause alarms for specified number of minutes."""
         self.is_paused = True
         self.pause_until = datetime.now() + timedelta(minutes=minutes)
-        if hasattr(self, 'icon'):
-            self.icon.icon = self.get_current_image()
+        self.refresh_icon()
+        self._alarm_wake.set()
 
     def unpause_alarms(self) -> None:
         """Resume alarms from paused state."""
         self.is_paused = False
         self.pause_until = None
-        if hasattr(self, 'icon'):
-            self.icon.icon = self.get_current_image()
+        self.refresh_icon()
+        self._alarm_wake.set()
+
+    def _play_sound(self, alarm_type: str) -> None:
+        """Play the preloaded sound for an alarm type, if available."""
+        sound = self._sounds.get(alarm_type)
+        if sound is not None:
+            try:
+                self._channel.play(sound)
+            except Exception:
+                pass
 
     def test_sound(self, alarm_type: str) -> None:
         """Play a test sound manually from the menu."""
-        try:
-            if alarm_type == "halfpast" and os.path.exists(self.halfpast_sound):
-                pygame.mixer.music.load(self.halfpast_sound)
-                pygame.mixer.music.play()
-            elif alarm_type == "bell" and os.path.exists(self.bell_sound):
-                pygame.mixer.music.load(self.bell_sound)
-                pygame.mixer.music.play()
-        except Exception:
-            pass
+        self._play_sound(alarm_type)
 
     def play_alarm(self, alarm_type: str) -> None:
-        """Play alarm sound if conditions are met."""
+        """Play alarm sound unless alarms are paused.
+
+        Work hours are not checked here, the alarm worker only ever schedules
+        alarms that fall inside them.
+        """
         # Don't play alarms if paused
         if self.is_paused:
             return
 
-        # Don't play alarms outside work hours (double check)
-        now = datetime.now()
-        work_start = self.config.get("work_start_hour")
-        work_end = self.config.get("work_end_hour")
-        if not (work_start <= now.hour < work_end):
-            return
-
-        try:
-            if alarm_type == "halfpast" and os.path.exists(self.halfpast_sound):
-                pygame.mixer.music.load(self.halfpast_sound)
-                pygame.mixer.music.play()
-            elif alarm_type == "bell" and os.path.exists(self.bell_sound):
-                pygame.mixer.music.load(self.bell_sound)
-                pygame.mixer.music.play()
-        except Exception:
-            pass
+        self._play_sound(alarm_type)
 
     def exit_app(self) -> None:
         """Clean up and exit the application."""
-        self.alarm_timer.stop()
-        if hasattr(self, 'icon'):
+        self._alarm_stop.set()
+        self._alarm_wake.set()
+        if self.icon is not None:
             self.icon.stop()
 
     def run(self) -> None:
@@ -29,6 +29,9 @@ setup(
     py_modules=["pyalarm"],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "pyalarm=pyalarm:main",